@@ -0,0 +1,227 @@
+import itertools
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import streamlit as st
+
+_PALETTE: Tuple[str, ...] = ('#3b82f6', '#8b5cf6', '#10b981', '#f59e0b', '#ef4444')
+
+# Static styling shared by every line chart; built once per process rather than per call.
+# Plotly copies these into each figure, so they are never mutated.
+_LINE_TITLE_FONT: Dict = {'size': 18, 'color': '#ffffff', 'family': 'Inter'}
+_LINE_AXIS: Dict = dict(
+    showgrid=True,
+    gridwidth=1,
+    gridcolor='rgba(148, 163, 184, 0.1)',
+    color='rgba(226, 232, 240, 0.7)'
+)
+_LINE_LAYOUT: Dict = dict(
+    margin=dict(l=10, r=10, t=50, b=10),
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#e2e8f0", family="Inter"),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="left",
+        x=0,
+        bgcolor="rgba(30, 41, 59, 0.6)",
+        bordercolor="rgba(148, 163, 184, 0.3)",
+        borderwidth=1
+    ),
+    hovermode='x unified',
+    xaxis=_LINE_AXIS,
+    yaxis=_LINE_AXIS,
+)
+
+# (min score, color, status CSS class, label, emoji), highest band first
+SCORE_BUCKETS: Tuple[Tuple[int, str, str, str, str], ...] = (
+    (67, "#10b981", "status-healthy", "Healthy", "✅"),
+    (45, "#f59e0b", "status-moderate", "Moderate", "⚠️"),
+    (0, "#ef4444", "status-warning", "Warning", "🚨"),
+)
+
+def score_bucket(score: int) -> Tuple[int, str, str, str, str]:
+    """Return the SCORE_BUCKETS entry a health score falls into"""
+    return next((b for b in SCORE_BUCKETS if score >= b[0]), SCORE_BUCKETS[-1])
+
+# Line charts longer than this are LTTB-downsampled to LTTB_POINTS per trace before plotting
+LTTB_THRESHOLD = 1500
+LTTB_POINTS = 800
+# Short series draw as SVG Scatter; WebGL only pays off past this many points, and each
+# Scattergl chart holds one of the browser's limited WebGL contexts.
+WEBGL_THRESHOLD = 1000
+
+# Every sparkline shares the same layout; only the trace differs.
+_SPARKLINE_AXIS: Dict = dict(showgrid=False, showticklabels=False, zeroline=False)
+_SPARKLINE_LAYOUT: Dict = dict(
+    showlegend=False,
+    margin=dict(l=0, r=0, t=0, b=0),
+    height=60,
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+    xaxis=_SPARKLINE_AXIS,
+    yaxis=_SPARKLINE_AXIS,
+    hovermode='x'
+)
+
+_GAUGE_RADIUS = 85
+_GAUGE_ARC_LENGTH = math.pi * _GAUGE_RADIUS
+
+def gauge_svg(score: int, title: str = "Economy Health Score") -> str:
+    """Inline SVG half-dial for the health score, so a single number doesn't need a Plotly figure"""
+    color = score_bucket(score)[1]
+    filled = max(0, min(score, 100)) / 100 * _GAUGE_ARC_LENGTH
+    arc = f"M {100 - _GAUGE_RADIUS} 110 A {_GAUGE_RADIUS} {_GAUGE_RADIUS} 0 0 1 {100 + _GAUGE_RADIUS} 110"
+    return f"""<div style="text-align: center; padding: 1rem 0;">
+<svg viewBox="0 0 200 135" style="width: 100%; max-width: 440px; height: auto;" role="img" aria-label="{title}: {score} out of 100">
+<path d="{arc}" fill="none" stroke="rgba(148, 163, 184, 0.25)" stroke-width="14" stroke-linecap="round"/>
+<path d="{arc}" fill="none" stroke="{color}" stroke-width="14" stroke-linecap="round" stroke-dasharray="{filled:.1f} 1000"/>
+<text x="100" y="100" text-anchor="middle" fill="{color}" font-size="40" font-weight="800" font-family="Inter, sans-serif">{score}</text>
+<text x="100" y="130" text-anchor="middle" fill="#e2e8f0" font-size="11" font-family="Inter, sans-serif">{title}</text>
+</svg>
+</div>"""
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling of (x, y) to n_out points"""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:nhi].mean(), y[hi:nhi].mean()
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+def _numeric_x(x: np.ndarray) -> np.ndarray:
+    return x.astype(np.int64).astype(float) if np.issubdtype(x.dtype, np.datetime64) else np.arange(len(x), dtype=float)
+
+def _downsample(x: np.ndarray, x_num: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """LTTB-reduce one trace's non-NaN points to LTTB_POINTS"""
+    valid = ~np.isnan(y)
+    keep = _lttb(x_num[valid], y[valid], LTTB_POINTS)
+    return x[valid][keep], y[valid][keep]
+
+# Memoized on the frame's contents, so reruns with unchanged data skip downsampling and figure building
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def create_enhanced_line_chart(df: pd.DataFrame, title: str, height: int = 400) -> go.Figure:
+    """Create enhanced line chart with modern styling"""
+    # Hand Plotly plain ndarrays and build the figure in one shot instead of add_trace per column
+    x = df.index.to_numpy()
+    values = df.to_numpy(dtype=float)
+    downsample = len(df) > LTTB_THRESHOLD
+    if downsample:
+        x_num = _numeric_x(x)
+    
+    trace_type = go.Scattergl if len(df) > WEBGL_THRESHOLD else go.Scatter
+    traces = []
+    for i, (col, color) in enumerate(zip(df.columns, itertools.cycle(_PALETTE))):
+        xs, ys = x, values[:, i]
+        if downsample:
+            xs, ys = _downsample(xs, x_num, ys)
+        traces.append(trace_type(
+            x=xs,
+            y=ys,
+            mode='lines',
+            name=col,
+            line=dict(width=3, color=color),
+            hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Value: %{y:,.2f}<extra></extra>'
+        ))
+    fig = go.Figure(data=traces)
+    
+    fig.update_layout(
+        title={'text': title, 'font': _LINE_TITLE_FONT},
+        height=height,
+        **_LINE_LAYOUT
+    )
+    
+    return fig
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def create_stacked_line_chart(series: Tuple[Tuple[str, pd.Series], ...], row_height: int = 300) -> go.Figure:
+    """Stack single-series line charts as rows of one figure sharing the date axis"""
+    fig = make_subplots(
+        rows=len(series),
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.06,
+        subplot_titles=[title for title, _ in series],
+    )
+    for row, ((title, s), color) in enumerate(zip(series, itertools.cycle(_PALETTE)), start=1):
+        x, y = s.index.to_numpy(), s.to_numpy(dtype=float)
+        trace_type = go.Scattergl if len(x) > WEBGL_THRESHOLD else go.Scatter
+        if len(x) > LTTB_THRESHOLD:
+            x, y = _downsample(x, _numeric_x(x), y)
+        fig.add_trace(trace_type(
+            x=x,
+            y=y,
+            mode='lines',
+            name=title,
+            line=dict(width=3, color=color),
+            hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Value: %{y:,.2f}<extra></extra>'
+        ), row=row, col=1)
+    
+    fig.update_layout(height=row_height * len(series), showlegend=False, **_LINE_LAYOUT)
+    fig.update_xaxes(**_LINE_AXIS)
+    fig.update_yaxes(**_LINE_AXIS)
+    fig.update_annotations(font={**_LINE_TITLE_FONT, 'size': 16})
+    
+    return fig
+
+_HEATMAP_LAYOUT: Dict = dict(
+    title="Return Correlations",
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#e2e8f0", family="Inter"),
+    height=400,
+    xaxis=dict(side='bottom'),
+    yaxis=dict(side='left'),
+)
+
+# Keyed on the (small) correlation matrix, so reruns with unchanged prices reuse the built figure
+@st.cache_data(ttl=15 * 60, show_spinner=False)
+def create_correlation_heatmap(corr: pd.DataFrame) -> go.Figure:
+    """Annotated heatmap of a correlation matrix"""
+    return go.Figure(
+        data=[go.Heatmap(
+            z=corr.values,
+            x=corr.columns,
+            y=corr.index,
+            colorscale='RdBu',
+            zmid=0,
+            texttemplate='%{z:.2f}',
+            textfont={"size": 12},
+            colorbar=dict(title="Correlation")
+        )],
+        layout=_HEATMAP_LAYOUT,
+    )
+
+def create_sparkline(series: pd.Series, color: str = '#3b82f6') -> go.Figure:
+    """Create minimal sparkline chart"""
+    return go.Figure(
+        data=[go.Scatter(
+            x=series.index,
+            y=series.values,
+            mode='lines',
+            line=dict(color=color, width=2),
+            fill='tozeroy',
+            fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.1)',
+            hovertemplate='%{y:,.2f}<extra></extra>'
+        )],
+        layout=_SPARKLINE_LAYOUT
+    )
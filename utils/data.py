@@ -1,84 +1,163 @@
 import datetime as dt
-from typing import List, Optional
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-import requests
 import streamlit as st
 
-def _get_fred_client():
+from utils.http import SESSION
+
+try:
+    from fredapi import Fred  # type: ignore
+except Exception:
+    Fred = None
+
+# Second-level cache on disk so a process restart does not refetch everything.
+# st.cache_data in app.py remains the in-process first level.
+DISK_CACHE_DIR = Path(tempfile.gettempdir()) / "econ_cache"
+
+def _disk_cached_at(key: str, ttl: int, fetch: Callable[[], Optional[pd.DataFrame]]) -> Tuple[float, Optional[pd.DataFrame]]:
+    """_disk_cached that also returns when the data was actually downloaded (file mtime on a hit)."""
+    path = DISK_CACHE_DIR / f"{key}.parquet"
     try:
-        from fredapi import Fred  # type: ignore
-    except Exception as e:
-        raise RuntimeError("Missing dependency 'fredapi'. Add it to requirements.txt.") from e
+        mtime = path.stat().st_mtime
+        if time.time() - mtime < ttl:
+            return mtime, pd.read_parquet(path)
+    except Exception:
+        pass
+    fetched_at = time.time()
+    df = fetch()
+    if df is not None and not df.empty:
+        try:
+            DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            df.to_parquet(tmp)
+            os.replace(tmp, path)
+        except Exception:
+            pass
+    return fetched_at, df
+
+def _disk_cached(key: str, ttl: int, fetch: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+    return _disk_cached_at(key, ttl, fetch)[1]
+
+@st.cache_resource(show_spinner=False)
+def _get_fred_client():
+    # One client per process, shared by every series fetch and worker thread.
+    if Fred is None:
+        raise RuntimeError("Missing dependency 'fredapi'. Add it to requirements.txt.")
     api_key = st.secrets.get("FRED_API_KEY", None)
     return Fred(api_key=api_key) if api_key else Fred()
 
-def get_fred_series(series_id: str, start: dt.date, end: dt.date) -> Optional[pd.Series]:
-    try:
+def _as_date(d) -> dt.date:
+    return d.date() if isinstance(d, dt.datetime) else d
+
+def fetch_fred_series(series_id: str, start: dt.date, end: dt.date) -> Tuple[float, Optional[pd.Series]]:
+    """Fetch one FRED series as (downloaded-at timestamp, series); raises on failure. Safe to call from worker threads."""
+    # Plain dates so a datetime and a date for the same day share one cache entry
+    return _fetch_fred_series(series_id, _as_date(start), _as_date(end))
+
+# FRED publishes at most daily. Exceptions are never cached, so a failed fetch is retried next run.
+# The download time travels with the series so callers can report true freshness through this memo.
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _fetch_fred_series(series_id: str, start: dt.date, end: dt.date) -> Tuple[float, Optional[pd.Series]]:
+    def download() -> Optional[pd.DataFrame]:
         fred = _get_fred_client()
         s = fred.get_series(series_id, observation_start=start, observation_end=end)
         if s is None or len(s) == 0:
             return None
+        return s.to_frame("value")
+
+    fetched_at, df = _disk_cached_at(f"fred_{series_id}_{start}_{end}", 60 * 60, download)
+    if df is None:
+        return fetched_at, None
+    s = df["value"].rename(None)
+    if not isinstance(s.index, pd.DatetimeIndex):
         s.index = pd.to_datetime(s.index)
-        return s.sort_index()
-    except Exception as e:
-        st.warning(f"FRED series '{series_id}' failed to load: {e}")
-        return None
+    return fetched_at, s.sort_index()
 
-def get_yf_history(tickers: List[str], start: dt.date, end: dt.date) -> pd.DataFrame:
+def get_yf_history(tickers: Sequence[str], start: dt.date, end: dt.date) -> pd.DataFrame:
     try:
         import yfinance as yf  # type: ignore
     except Exception as e:
         raise RuntimeError("Missing dependency 'yfinance'. Add it to requirements.txt.") from e
-    df = yf.download(
-        tickers=tickers,
-        start=pd.Timestamp(start),
-        end=pd.Timestamp(end) + pd.Timedelta(days=1),
-        auto_adjust=False,
-        progress=False,
-        group_by="ticker",
-    )
-    out = pd.DataFrame()
-    if isinstance(df.columns, pd.MultiIndex):
-        for t in tickers:
-            if (t, "Adj Close") in df.columns:
-                out[t] = df[(t, "Adj Close")]
-    else:
-        if "Adj Close" in df.columns and len(tickers) == 1:
-            out[tickers[0]] = df["Adj Close"]
-    out.index = pd.to_datetime(out.index)
-    return out.dropna(how="all")
-
-def normalize_index(s: pd.Series, base: float = 100.0) -> pd.Series:
-    s = s.dropna()
-    if s.empty:
-        return s
-    return (s / float(s.iloc[0])) * base
+    tickers = list(tickers)
+
+    def download() -> pd.DataFrame:
+        # One batched download for all symbols rather than a request per ticker.
+        df = yf.download(
+            tickers=" ".join(tickers),
+            start=pd.Timestamp(start),
+            end=pd.Timestamp(end) + pd.Timedelta(days=1),
+            auto_adjust=False,
+            progress=False,
+            group_by="ticker",
+            threads=True,
+        )
+        out = pd.DataFrame()
+        if isinstance(df.columns, pd.MultiIndex):
+            # Pull every ticker's Adj Close in one cross-section rather than column by column
+            if "Adj Close" in df.columns.get_level_values(1):
+                adj = df.xs("Adj Close", axis=1, level=1)
+                out = adj[[t for t in tickers if t in adj.columns]]
+        else:
+            if "Adj Close" in df.columns and len(tickers) == 1:
+                out[tickers[0]] = df["Adj Close"]
+        if not isinstance(out.index, pd.DatetimeIndex):
+            out.index = pd.to_datetime(out.index)
+        return out.dropna(how="all")
+
+    return _disk_cached(f"yf_{'-'.join(tickers)}_{start}_{end}", 15 * 60, download)
+
+def normalize_frame(df: pd.DataFrame, base: float = 100.0) -> pd.DataFrame:
+    """Rebase every column to `base` at its first valid row, in one vectorized divide."""
+    return df.div(df.bfill().iloc[0]).mul(base)
+
+def _valid_tail(s: pd.Series, n: int) -> np.ndarray:
+    """Last n non-NaN values, oldest first, found by scanning back from the end of the raw array."""
+    a = s.to_numpy()
+    # Walks only as far as the trailing NaNs plus n, rather than masking the whole history
+    found: List[float] = []
+    i = a.size - 1
+    while i >= 0 and len(found) < n:
+        v = a[i]
+        # pd.notna matches dropna: NaN, None, NaT and pd.NA are all skipped
+        if pd.notna(v):
+            found.append(v)
+        i -= 1
+    return np.array(found[::-1], dtype=a.dtype)
 
 def latest_value(s: Optional[pd.Series]) -> Optional[float]:
     if s is None:
         return None
-    x = s.dropna()
-    if x.empty:
+    x = _valid_tail(s, 1)
+    if x.size == 0:
         return None
-    return float(x.iloc[-1])
+    return float(x[-1])
 
-def pct_change(s: Optional[pd.Series], periods: int = 1) -> Optional[float]:
+def latest_and_change(s: Optional[pd.Series], periods: int = 1) -> Tuple[Optional[float], Optional[float]]:
+    """Latest value and its percent change over `periods` observations, from one scan of the trailing values."""
     if s is None:
-        return None
-    x = s.dropna()
-    if len(x) <= periods:
-        return None
-    prev = float(x.iloc[-periods-1])
-    cur = float(x.iloc[-1])
+        return None, None
+    x = _valid_tail(s, periods + 1)
+    if x.size == 0:
+        return None, None
+    cur = float(x[-1])
+    if x.size <= periods:
+        return cur, None
+    prev = float(x[0])
     if prev == 0:
-        return None
-    return (cur / prev - 1.0) * 100.0
+        return cur, None
+    return cur, (cur / prev - 1.0) * 100.0
 
 def get_treasury_debt_to_penny() -> float:
     url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/debt_to_penny"
     params = {"sort": "-record_date", "page[size]": "1", "fields": "record_date,total_public_debt_outstanding"}
-    r = requests.get(url, params=params, timeout=20)
+    r = SESSION.get(url, params=params, timeout=20)
     r.raise_for_status()
     data = r.json()
     return float(data["data"][0]["total_public_debt_outstanding"])
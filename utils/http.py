@@ -0,0 +1,35 @@
+import tempfile
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from cachecontrol.adapter import CacheControlAdapter  # type: ignore
+    from cachecontrol.caches.file_cache import FileCache  # type: ignore
+except Exception:
+    CacheControlAdapter = None
+
+WEB_CACHE_DIR = Path(tempfile.gettempdir()) / "econ_webcache"
+
+# Keep-alive pool shared by the Treasury and GDELT calls; transient 5xx/connection
+# failures get two quick retries before the caller sees the error.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    pool = dict(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY)
+    if CacheControlAdapter is not None:
+        # Stores ETag/Last-Modified and revalidates with conditional GETs, so an
+        # unchanged resource comes back as a bodyless 304 served from disk.
+        adapter = CacheControlAdapter(cache=FileCache(str(WEB_CACHE_DIR)), **pool)
+    else:
+        adapter = HTTPAdapter(**pool)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+SESSION = _build_session()
@@ -1,5 +1,7 @@
+import re
 from typing import List, Dict
-import requests
+
+from utils.http import SESSION
 
 def gdelt_latest(query: str = "US economy OR recession OR inflation OR jobs OR Federal Reserve", max_records: int = 12) -> List[Dict]:
     """Free, no-key headline pull from GDELT 2.1 DOC API."""
@@ -13,7 +15,7 @@ def gdelt_latest(query: str = "US economy OR recession OR inflation OR jobs OR F
         "sort": "HybridRel",
         "sourcelang": "english",
     }
-    r = requests.get(url, params=params, timeout=20)
+    r = SESSION.get(url, params=params, timeout=20)
     r.raise_for_status()
     data = r.json()
     arts = data.get("articles", []) or []
@@ -26,3 +28,15 @@ def gdelt_latest(query: str = "US economy OR recession OR inflation OR jobs OR F
             "seen": a.get("seendate", ""),
         })
     return out
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a flat OR query (whitespace collapsed, clauses deduped and sorted) for cache keys."""
+    q = " ".join(query.split())
+    if "(" in q or '"' in q:
+        return q
+    clauses: Dict[str, str] = {}
+    for c in re.split(r"\s+OR\s+", q):
+        c = c.strip()
+        if c:
+            clauses.setdefault(c.lower(), c)
+    return " OR ".join(clauses[k] for k in sorted(clauses))
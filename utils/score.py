@@ -1,51 +1,58 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+import numpy as np
 import pandas as pd
 
-def zscore_latest(s: Optional[pd.Series], window: int = 252) -> Optional[float]:
-    if s is None:
-        return None
-    x = s.dropna()
-    if x.empty:
-        return None
-    xw = x.iloc[-window:] if len(x) > window else x
-    mu = float(xw.mean())
-    sig = float(xw.std(ddof=0))
-    if sig == 0:
-        return None
-    return (float(x.iloc[-1]) - mu) / sig
-
-def clamp(x: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, x))
-
 def compute_us_health_score(fred: Dict[str, Optional[pd.Series]], prices_df: pd.DataFrame) -> Dict[str, object]:
-    components: List[dict] = []
-
-    def add_component(name: str, series: Optional[pd.Series], direction: int, weight: float, window: int):
-        z = zscore_latest(series, window=window)
-        if z is None:
-            return
-        zc = clamp(direction * z, -2.0, 2.0)
-        score = int(round(((zc + 2.0) / 4.0) * 100.0))
-        components.append({"name": name, "z": float(z), "score": score, "weight": float(weight)})
-
-    add_component("Unemployment (UNRATE)", fred.get("UNRATE"), direction=-1, weight=0.16, window=60)
-    add_component("Payrolls (PAYEMS)", fred.get("PAYEMS"), direction=+1, weight=0.14, window=60)
-    add_component("Jobless Claims (ICSA)", fred.get("ICSA"), direction=-1, weight=0.10, window=104)
-
-    add_component("CPI (CPIAUCSL)", fred.get("CPIAUCSL"), direction=-1, weight=0.10, window=60)
-    add_component("Fed Funds (FEDFUNDS)", fred.get("FEDFUNDS"), direction=-1, weight=0.06, window=120)
-
-    if "SPY" in prices_df.columns:
-        add_component("SPY (price)", prices_df["SPY"], direction=+1, weight=0.10, window=252)
-    if "VTI" in prices_df.columns:
-        add_component("VTI (price)", prices_df["VTI"], direction=+1, weight=0.08, window=252)
-    add_component("VIX (VIXCLS)", fred.get("VIXCLS"), direction=-1, weight=0.10, window=252)
-
-    add_component("CC Delinq. (DRCCLACBS)", fred.get("DRCCLACBS"), direction=-1, weight=0.06, window=80)
-
-    if not components:
+    specs: List[Tuple[str, Optional[pd.Series], int, float, int]] = [
+        ("Unemployment (UNRATE)", fred.get("UNRATE"), -1, 0.16, 60),
+        ("Payrolls (PAYEMS)", fred.get("PAYEMS"), +1, 0.14, 60),
+        ("Jobless Claims (ICSA)", fred.get("ICSA"), -1, 0.10, 104),
+
+        ("CPI (CPIAUCSL)", fred.get("CPIAUCSL"), -1, 0.10, 60),
+        ("Fed Funds (FEDFUNDS)", fred.get("FEDFUNDS"), -1, 0.06, 120),
+
+        ("SPY (price)", prices_df["SPY"] if "SPY" in prices_df.columns else None, +1, 0.10, 252),
+        ("VTI (price)", prices_df["VTI"] if "VTI" in prices_df.columns else None, +1, 0.08, 252),
+        ("VIX (VIXCLS)", fred.get("VIXCLS"), -1, 0.10, 252),
+
+        ("CC Delinq. (DRCCLACBS)", fred.get("DRCCLACBS"), -1, 0.06, 80),
+    ]
+
+    # Stack each component's trailing window into one NaN-padded matrix so the
+    # mean/std for every component come from a single vectorized pass.
+    rows = []
+    for name, series, direction, weight, window in specs:
+        if series is None:
+            continue
+        x = series.to_numpy(dtype=np.float64)
+        x = x[~np.isnan(x)][-window:]
+        if x.size:
+            rows.append((name, direction, weight, x))
+
+    if not rows:
         return {"score": 50, "components": []}
 
-    total_w = sum(c["weight"] for c in components)
-    score = sum(c["score"] * c["weight"] for c in components) / total_w
+    windows = np.full((len(rows), max(r[3].size for r in rows)), np.nan)
+    for i, (_, _, _, x) in enumerate(rows):
+        windows[i, :x.size] = x
+    last = np.array([r[3][-1] for r in rows])
+    direction = np.array([r[1] for r in rows], dtype=np.float64)
+    weights = np.array([r[2] for r in rows], dtype=np.float64)
+    mu = np.nanmean(windows, axis=1)
+    sig = np.nanstd(windows, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (last - mu) / sig
+    zc = np.clip(direction * z, -2.0, 2.0)
+    scores = np.round((zc + 2.0) / 4.0 * 100.0)
+
+    # A flat window has no spread to score against; drop those components.
+    keep = np.flatnonzero(sig != 0)
+    if keep.size == 0:
+        return {"score": 50, "components": []}
+    components = [
+        {"name": rows[i][0], "z": float(z[i]), "score": int(scores[i]), "weight": float(weights[i])}
+        for i in keep
+    ]
+    # Weighted mean as one dot product over the kept components
+    score = float(np.dot(scores[keep], weights[keep]) / weights[keep].sum())
     return {"score": int(round(score)), "components": components}